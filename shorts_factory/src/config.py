@@ -3,7 +3,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 
 @dataclass(frozen=True)
@@ -16,9 +18,12 @@ class AppPaths:
     assets: Path
     output: Path
     logs: Path
+    cache: Path
 
     @classmethod
+    @lru_cache(maxsize=None)
     def discover(cls) -> "AppPaths":
+        # Frozen, so one resolved instance is shared for the process lifetime.
         # src/config.py -> src -> shorts_factory root
         root = Path(__file__).resolve().parents[1]
         return cls(
@@ -28,12 +33,13 @@ class AppPaths:
             assets=root / "assets",
             output=root / "output",
             logs=root / "logs",
+            cache=root / "cache",
         )
 
     def ensure_directories(self) -> None:
-        for folder in [self.scripts, self.audio, self.assets, self.output, self.logs]:
+        for folder in [self.scripts, self.audio, self.assets, self.output, self.logs, self.cache]:
             folder.mkdir(parents=True, exist_ok=True)
 
 
-def timestamp_slug() -> str:
-    return datetime.now().strftime("%Y%m%d_%H%M%S")
+def timestamp_slug(moment: Optional[datetime] = None) -> str:
+    return (moment or datetime.now()).strftime("%Y%m%d_%H%M%S")
@@ -1,7 +1,10 @@
 """Centralized logging setup."""
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 
@@ -19,10 +22,16 @@ def build_logger(log_file: Path) -> logging.Logger:
 
     stream_handler = logging.StreamHandler()
     stream_handler.setFormatter(formatter)
-    logger.addHandler(stream_handler)
 
     file_handler = logging.FileHandler(log_file, encoding="utf-8")
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
 
+    # Callers only enqueue records; a background listener does the blocking
+    # console/file writes. Stopping it at exit drains anything still queued.
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = QueueListener(log_queue, stream_handler, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    logger.addHandler(QueueHandler(log_queue))
     return logger
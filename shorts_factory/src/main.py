@@ -11,7 +11,17 @@ from .logger_setup import build_logger
 from .script_generator import generate_script
 from .subtitle_generator import generate_subtitles, save_srt
 from .tts_engine import TTSError, VoiceConfig, script_to_audio
-from .video_builder import build_short_video
+from .video_builder import build_short_video, default_render_threads
+
+
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got '{value}'") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got '{value}'")
+    return number
 
 
 def parse_args() -> argparse.Namespace:
@@ -51,6 +61,19 @@ def parse_args() -> argparse.Namespace:
         default="com",
         help="gTTS top-level domain for stable voice variant",
     )
+    parser.add_argument(
+        "--render-preset",
+        type=str,
+        default="medium",
+        choices=["ultrafast", "superfast", "veryfast", "faster", "fast", "medium", "slow"],
+        help="x264 encoder preset (faster presets render quicker at larger file size)",
+    )
+    parser.add_argument(
+        "--render-threads",
+        type=_positive_int,
+        default=default_render_threads(),
+        help="Max ffmpeg encoder threads (default: min(4, CPU count))",
+    )
     return parser.parse_args()
 
 
@@ -79,6 +102,11 @@ def run() -> int:
     logger.info("Starting run for channel='%s', style='%s'", args.channel, args.style)
 
     try:
+        # Validate inputs before any network-bound TTS work so bad paths fail fast.
+        background = Path(args.background).expanduser().resolve() if args.background else None
+        if background and not background.exists():
+            raise FileNotFoundError(f"Background file not found: {background}")
+
         script_text, script_path = load_or_generate_script(
             script_file=args.script_file,
             style=args.style,
@@ -93,22 +121,25 @@ def run() -> int:
         video_path = paths.output / f"{args.style}_{stamp}.mp4"
 
         voice = VoiceConfig(language=args.voice_lang, tld=args.voice_tld, slow=False)
-        script_to_audio(script_text=script_text, output_audio=audio_path, voice=voice)
+        script_to_audio(
+            script_text=script_text,
+            output_audio=audio_path,
+            voice=voice,
+            cache_dir=paths.cache,
+        )
         logger.info("Audio generated: %s", audio_path)
 
         subtitles = generate_subtitles(script_text=script_text, audio_file=audio_path)
         save_srt(subtitles, srt_path)
         logger.info("Subtitles generated: %s", srt_path)
 
-        background = Path(args.background).expanduser().resolve() if args.background else None
-        if background and not background.exists():
-            raise FileNotFoundError(f"Background file not found: {background}")
-
         build_short_video(
             audio_path=audio_path,
             subtitles=subtitles,
             output_path=video_path,
             background_path=background,
+            preset=args.render_preset,
+            threads=args.render_threads,
         )
         logger.info("Video exported: %s", video_path)
 
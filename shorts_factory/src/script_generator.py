@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from random import choice
+from typing import Dict, Tuple
 
 from .config import timestamp_slug
 
@@ -15,30 +16,30 @@ class ScriptResult:
     script_path: Path
 
 
-TOPICS = {
-    "tech": [
+TOPICS: Dict[str, Tuple[str, ...]] = {
+    "tech": (
         "One hidden smartphone setting that boosts battery life.",
         "3 keyboard shortcuts that make you 2x faster.",
         "A tiny automation trick that saves 30 minutes daily.",
-    ],
-    "funny": [
+    ),
+    "funny": (
         "When your alarm rings and you negotiate for five more minutes.",
         "That one friend who says 'I'm outside' but is still at home.",
         "Office Wi-Fi during meetings vs during lunch break.",
-    ],
-    "bhakti": [
+    ),
+    "bhakti": (
         "Start your morning with gratitude and one deep breath.",
         "Discipline is devotion in action.",
         "Let your effort be your prayer and your patience be your strength.",
-    ],
-    "mirzapuri": [
+    ),
+    "mirzapuri": (
         "Are bhai, je zindagi hae na, dheere-dheere samajh mein aavat hae.",
         "Mehnat karo, naam khud ban jaayi Mirzapur style mein.",
         "Gali ke joke aur asli dosti, ee dono priceless ba.",
-    ],
+    ),
 }
 
-OUTROS = {
+OUTROS: Dict[str, str] = {
     "tech": "Follow for more practical tech hacks every day!",
     "funny": "Like, share, and tag your funniest friend!",
     "bhakti": "Har din ek achchi soch ke saath shuru kariye. Jai ho.",
@@ -66,7 +67,8 @@ def generate_script(style: str, channel_name: str, scripts_dir: Path) -> ScriptR
 
     script_text = f"{opening} {mid} {topic} {outro}"
 
-    filename = f"{datetime.now().strftime('%Y-%m-%d')}_{normalized_style}_{timestamp_slug()}.txt"
+    now = datetime.now()
+    filename = f"{now.strftime('%Y-%m-%d')}_{normalized_style}_{timestamp_slug(now)}.txt"
     script_path = scripts_dir / filename
     script_path.write_text(script_text, encoding="utf-8")
 
@@ -41,27 +41,19 @@ def generate_subtitles(script_text: str, audio_file: Path, words_per_chunk: int
     return entries
 
 
+def _format_srt_timestamp(seconds: float) -> str:
+    total, ms = divmod(int(seconds * 1000), 1000)
+    m, s = divmod(total, 60)
+    h, m = divmod(m, 60)
+    return f"{h:02}:{m:02}:{s:02},{ms:03}"
+
+
 def save_srt(entries: List[SubtitleEntry], srt_path: Path) -> Path:
     """Save subtitle entries to SRT format."""
+    blocks = [
+        f"{i}\n{_format_srt_timestamp(entry.start)} --> {_format_srt_timestamp(entry.end)}\n{entry.text}\n"
+        for i, entry in enumerate(entries, start=1)
+    ]
 
-    def _format_ts(seconds: float) -> str:
-        ms = int((seconds - int(seconds)) * 1000)
-        total = int(seconds)
-        h = total // 3600
-        m = (total % 3600) // 60
-        s = total % 60
-        return f"{h:02}:{m:02}:{s:02},{ms:03}"
-
-    lines = []
-    for i, entry in enumerate(entries, start=1):
-        lines.extend(
-            [
-                str(i),
-                f"{_format_ts(entry.start)} --> {_format_ts(entry.end)}",
-                entry.text,
-                "",
-            ]
-        )
-
-    srt_path.write_text("\n".join(lines), encoding="utf-8")
+    srt_path.write_text("\n".join(blocks), encoding="utf-8")
     return srt_path
@@ -1,11 +1,22 @@
 """Free text-to-speech using gTTS with stable configuration."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from dataclasses import asdict, dataclass
 from pathlib import Path
+from typing import Optional
 
 from gtts import gTTS
 
+TTS_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class VoiceConfig:
@@ -18,11 +29,81 @@ class TTSError(Exception):
     """Raised when TTS conversion fails."""
 
 
-def script_to_audio(script_text: str, output_audio: Path, voice: VoiceConfig) -> Path:
-    """Convert script text to MP3 audio with consistent voice settings."""
+def _cache_key(script_text: str, voice: VoiceConfig) -> str:
+    payload = json.dumps({"text": script_text, **asdict(voice)}, sort_keys=True, ensure_ascii=False)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _evict_lru(cache_dir: Path, max_bytes: int) -> None:
+    entries = []
+    with os.scandir(cache_dir) as it:
+        for e in it:
+            if not (e.name.startswith("tts_") and e.name.endswith(".mp3")):
+                continue
+            try:
+                if e.is_file():
+                    st = e.stat()
+                    entries.append((st.st_mtime, st.st_size, e.path))
+            except FileNotFoundError:
+                continue  # removed concurrently
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+
+
+def _store_in_cache(audio: Path, cached: Path) -> None:
+    # Copy under a temp name and swap it in atomically so an interrupted copy
+    # never leaves a truncated MP3 under the final cache key.
+    fd, tmp = tempfile.mkstemp(dir=cached.parent, prefix=".tts_", suffix=".tmp")
+    os.close(fd)
+    try:
+        shutil.copyfile(audio, tmp)
+        os.replace(tmp, cached)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def script_to_audio(
+    script_text: str,
+    output_audio: Path,
+    voice: VoiceConfig,
+    cache_dir: Optional[Path] = None,
+) -> Path:
+    """Convert script text to MP3 audio with consistent voice settings.
+
+    When ``cache_dir`` is given, audio is reused for identical text + voice settings.
+    The cache is best-effort: cache IO errors are logged and never fail the run.
+    """
+    cached = cache_dir / f"tts_{_cache_key(script_text, voice)}.mp3" if cache_dir else None
+    if cached and cached.exists():
+        try:
+            shutil.copyfile(cached, output_audio)
+            os.utime(cached)  # mark as recently used for eviction
+            return output_audio
+        except OSError as exc:
+            logger.warning("TTS cache read failed, synthesizing instead: %s", exc)
+
     try:
         tts = gTTS(text=script_text, lang=voice.language, tld=voice.tld, slow=voice.slow)
         tts.save(str(output_audio))
-        return output_audio
     except Exception as exc:  # noqa: BLE001
         raise TTSError(f"Failed to convert text to speech: {exc}") from exc
+
+    if cached:
+        try:
+            _store_in_cache(output_audio, cached)
+            _evict_lru(cache_dir, TTS_CACHE_MAX_BYTES)
+        except OSError as exc:
+            logger.warning("TTS cache update skipped: %s", exc)
+    return output_audio
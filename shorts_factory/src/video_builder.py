@@ -1,37 +1,60 @@
 """Video rendering for 9:16 YouTube Shorts with subtitle overlays."""
 from __future__ import annotations
 
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+import numpy as np
 from moviepy.editor import (
     AudioFileClip,
     ColorClip,
     CompositeVideoClip,
     ImageClip,
     VideoFileClip,
-    concatenate_videoclips,
+    vfx,
 )
 from PIL import Image, ImageDraw, ImageFont
 
 from .subtitle_generator import SubtitleEntry
 
 
+def default_render_threads() -> int:
+    return min(4, os.cpu_count() or 1)
+
+
+@lru_cache(maxsize=4)
+def _load_font(font_size: int):
+    try:
+        return ImageFont.truetype("Arial.ttf", font_size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+@lru_cache(maxsize=4)
+def _subtitle_panel(width: int, height: int) -> Image.Image:
+    panel = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    margin = 40
+    ImageDraw.Draw(panel).rounded_rectangle(
+        [(margin, 20), (width - margin, height - 20)],
+        radius=24,
+        fill=(0, 0, 0, 160),
+    )
+    return panel
+
+
 def _build_subtitle_image(
     text: str,
     width: int,
     height: int = 220,
     font_size: int = 52,
 ) -> Image.Image:
-    image = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    # Copy the shared backdrop rather than redrawing the rounded panel per line.
+    image = _subtitle_panel(width, height).copy()
     draw = ImageDraw.Draw(image)
+    font = _load_font(font_size)
 
-    try:
-        font = ImageFont.truetype("Arial.ttf", font_size)
-    except OSError:
-        font = ImageFont.load_default()
-
-    margin = 40
     bbox = draw.multiline_textbbox((0, 0), text, font=font, align="center")
     text_w = bbox[2] - bbox[0]
     text_h = bbox[3] - bbox[1]
@@ -39,15 +62,19 @@ def _build_subtitle_image(
     x = (width - text_w) / 2
     y = (height - text_h) / 2
 
-    draw.rounded_rectangle(
-        [(margin, 20), (width - margin, height - 20)],
-        radius=24,
-        fill=(0, 0, 0, 160),
-    )
     draw.multiline_text((x, y), text, font=font, fill=(255, 255, 255, 255), align="center")
     return image
 
 
+@lru_cache(maxsize=32)
+def _subtitle_frame(text: str, width: int) -> np.ndarray:
+    # Repeated subtitle lines within a video reuse one rasterized RGBA array.
+    # It is shared across ImageClips, so keep it read-only.
+    frame = np.array(_build_subtitle_image(text, width=width))
+    frame.flags.writeable = False
+    return frame
+
+
 def _create_background_clip(background: Optional[Path], duration: float, size: Tuple[int, int]):
     if not background:
         return ColorClip(size=size, color=(20, 20, 20), duration=duration)
@@ -57,17 +84,13 @@ def _create_background_clip(background: Optional[Path], duration: float, size: T
         return ImageClip(str(background)).resize(newsize=size).set_duration(duration)
 
     if suffix in {".mp4", ".mov", ".mkv", ".webm"}:
-        video = VideoFileClip(str(background)).without_audio().resize(newsize=size)
+        # ffmpeg scales while decoding (target_resolution is height, width), so frames
+        # skip MoviePy's per-frame resize; audio=False avoids opening an unused reader.
+        video = VideoFileClip(str(background), audio=False, target_resolution=(size[1], size[0]))
         if video.duration >= duration:
             return video.subclip(0, duration)
-
-        loops: List[VideoFileClip] = []
-        consumed = 0.0
-        while consumed < duration:
-            part = video.subclip(0, min(video.duration, duration - consumed))
-            loops.append(part)
-            consumed += part.duration
-        return concatenate_videoclips(loops)
+        # Wrap playback time onto the single decoded source instead of chaining copies.
+        return video.fx(vfx.loop, duration=duration)
 
     raise ValueError(f"Unsupported background file type: {background.suffix}")
 
@@ -79,6 +102,8 @@ def build_short_video(
     background_path: Optional[Path] = None,
     size: Tuple[int, int] = (1080, 1920),
     fps: int = 30,
+    preset: str = "medium",
+    threads: Optional[int] = None,
 ) -> Path:
     """Create a short video with audio and subtitle overlays."""
     audio_clip = AudioFileClip(str(audio_path))
@@ -86,9 +111,8 @@ def build_short_video(
 
     subtitle_clips = []
     for entry in subtitles:
-        subtitle_image = _build_subtitle_image(entry.text, width=size[0])
         subtitle_clip = (
-            ImageClip(subtitle_image)
+            ImageClip(_subtitle_frame(entry.text, size[0]))
             .set_position(("center", size[1] - 400))
             .set_start(entry.start)
             .set_end(entry.end)
@@ -101,8 +125,8 @@ def build_short_video(
         codec="libx264",
         audio_codec="aac",
         fps=fps,
-        threads=4,
-        preset="medium",
+        threads=threads if threads is not None else default_render_threads(),
+        preset=preset,
     )
 
     final.close()